@@ -15,6 +15,7 @@ import os
 import re
 import sys
 import tarfile
+from functools import lru_cache
 from typing import Any, Dict
 
 from ..core.auth import AIHubAuth
@@ -24,7 +25,9 @@ from ..core.filelist_parser import AIHubResponseParser, sizeof_fmt
 from prettytable import PrettyTable
 
 
-def parse_arguments() -> Dict[str, Any]:
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once and reuse it for every parse."""
     parser = argparse.ArgumentParser(
         description="AIHub Dataset Downloader CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -102,6 +105,12 @@ Examples:
         description="Display AIHub API usage information"
     )
 
+    return parser
+
+
+def parse_arguments() -> Dict[str, Any]:
+    parser = _build_parser()
+
     # If no arguments provided, show help
     if len(sys.argv) == 1:
         parser.print_help(sys.stderr)
@@ -1,28 +1,75 @@
+import logging
+import math
 import re
+import sys
 from dataclasses import dataclass, field
 from functools import lru_cache
-from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Iterator, List, Optional, Tuple, Union
 
+logger = logging.getLogger(__name__)
 
+# Patterns used by AIHubResponseParser.parse_tree_output, compiled once at import
+# Split the tree formatting prefix and the path for lines like:
+# │   │       │   ├─ filename.zip | 11 MB | 69412
+# │   │       │   ├── filename.zip | 11 MB | 69412 (test format)
+# Matched line by line across the whole response body, hence MULTILINE and [^\S\n]
+_TREE_LINE_RE = re.compile(r"^(.*?)(?:└─+|├─+)[^\S\n]*(.*)$", re.MULTILINE)
+# Size column of a file entry, with optional spaces between number and unit
+_FILE_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([KMGT]?)B")
+# Byte multipliers for the size units the AIHub file tree reports
+_UNIT_MULTIPLIERS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+# Header and notice lines AIHub prints before the tree; markers are matched case-insensitively
+_PREAMBLE_PREFIXES = ("The contents are encoded", "If the following contents", "Please modify the character",
+                      "=================")
+_PREAMBLE_MARKERS = ("utf-8", "output normally", "modify the character information")
+# Tree drawing characters (and indentation) stripped from the front of the root line
+_TREE_PREFIX_CHARS = "└├│─ \t"
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep dict-backed nodes
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_SIZE_UNITS = ("", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei", "Zi")
+_KIB, _MIB, _GIB, _TIB = 1 << 10, 1 << 20, 1 << 30, 1 << 40
+
+
+# File listings repeat the same sizes a lot; bound the cache to keep memory flat
+@lru_cache(maxsize=2048)
 def sizeof_fmt(num, suffix="B", ignore_float=False):
-    for unit in ("", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei", "Zi"):
-        if abs(num) < 1024.0:
-            if ignore_float:
-                return f"{int(num)}{unit}{suffix}"
-            return f"{num:3.1f}{unit}{suffix}"
-        num /= 1024.0
-    return f"{num:.1f}Yi{suffix}"
+    # Nearly every file is below 1 TiB, so those units are picked with plain comparisons
+    magnitude = abs(num)
+    if magnitude < _KIB:
+        idx = 0
+    elif magnitude < _MIB:
+        idx, num = 1, num / _KIB
+    elif magnitude < _GIB:
+        idx, num = 2, num / _MIB
+    elif magnitude < _TIB:
+        idx, num = 3, num / _GIB
+    else:
+        # Work in float like repeated division by 1024 would, so huge ints round up into the
+        # next unit the same way; inf and nan have no bit length and land in Yi as before
+        num = float(num)
+        if not math.isfinite(num):
+            return f"{num:.1f}Yi{suffix}"
+        # Each unit is 10 bits wide, so the unit index falls out of the integer part's bit length
+        idx = (int(abs(num)).bit_length() - 1) // 10
+        if idx >= len(_SIZE_UNITS):
+            return f"{num / (1 << (10 * len(_SIZE_UNITS))):.1f}Yi{suffix}"
+        num /= 1 << (10 * idx)
+    if ignore_float:
+        return f"{int(num)}{_SIZE_UNITS[idx]}{suffix}"
+    return f"{num:3.1f}{_SIZE_UNITS[idx]}{suffix}"
 
 
 class AIHubResponseParser:
-    @dataclass
+    @dataclass(**_DATACLASS_SLOTS)
     class Node:
         """
         A node of a directory tree with references to parent and children as well as
         the path and depth.
         """
-        path: Optional[Path] = None
+        path: Optional[str] = None
         file_display_size: Optional[int] = None
         file_min_possible_size: Optional[int] = None
         file_max_possible_size: Optional[int] = None
@@ -30,6 +77,7 @@ class AIHubResponseParser:
         parent: Optional["AIHubResponseParser.Node"] = None
         children: List["AIHubResponseParser.Node"] = field(default_factory=list)
         depth: int = 0
+        _full_path: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
         def to_dict(self) -> Union[str, dict]:
             if len(self.children) == 0:
@@ -41,14 +89,41 @@ class AIHubResponseParser:
             # Directory node
             return {str(self.path): [child.to_dict() for child in self.children]}
 
-        def full_path(self) -> Path:
+        def full_path(self) -> str:
             """
             Get the full path for the node.
             """
-            if self.parent is None:
-                return self.path or Path(".")
-            parent_path = self.parent.full_path()
-            return parent_path / (self.path or Path("."))
+            if self._full_path is not None:
+                return self._full_path
+            # Walk up iteratively to the nearest ancestor with a known path, then
+            # fill in the cache on the way back down
+            pending = []
+            node = self
+            while node is not None and node._full_path is None:
+                pending.append(node)
+                node = node.parent
+            full_path = node._full_path if node is not None else None
+            for node in reversed(pending):
+                # "." components are dropped, matching how paths join
+                name = str(node.path) if node.path else "."
+                if full_path is None or full_path == ".":
+                    full_path = name
+                elif name != ".":
+                    full_path = f"{full_path}/{name}"
+                node._full_path = full_path
+            return full_path
+
+        def iter_files(self) -> Iterator[Tuple[str, Tuple[Optional[int], Optional[int], Optional[int]]]]:
+            """
+            Yield (full path, (display, min, max) size) for every file under this node in tree order.
+            """
+            stack = [self]
+            while stack:
+                node = stack.pop()
+                if node.file_key is not None:
+                    yield node.full_path(), (node.file_display_size, node.file_min_possible_size,
+                                             node.file_max_possible_size)
+                stack.extend(reversed(node.children))
 
     def parse_tree_output(self, body: str) -> Tuple[Optional[Node],
                                                     Optional[List[Tuple[str, bool, Optional[str],
@@ -58,78 +133,67 @@ class AIHubResponseParser:
         return a `Node` representing the parsed tree and a list of paths.
         """
         paths = []
+        paths_append = paths.append
 
         try:
-            body_lines = body.splitlines()
-
-            # Find the first line that contains the dataset name (skip UTF-8 headers and tree chars)
+            # Find the first line that contains the dataset name (skip UTF-8 headers and tree chars),
+            # stepping from newline to newline without splitting the whole body
             root_line = None
-            for line in body_lines:
-                if (not line.startswith("The contents are encoded") and
-                    not line.startswith("If the following contents") and
-                    not line.startswith("Please modify the character") and
-                    not line.startswith("=================") and
-                    not line.startswith("==========================================") and
-                    not line.strip().lower().startswith("utf-8") and
-                    not line.strip().lower().startswith("output normally") and
-                    not line.strip().lower().startswith("modify the character information") and
-                        line.strip() != ""):
+            start = 0
+            while start < len(body):
+                end = body.find("\n", start)
+                if end == -1:
+                    end = len(body)
+                line = body[start:end]
+                start = end + 1
+                stripped = line.strip().lower()
+                if stripped and not line.startswith(_PREAMBLE_PREFIXES) and not stripped.startswith(_PREAMBLE_MARKERS):
                     root_line = line
                     break
             if root_line is None:
                 # Fallback to first line
-                root_line = body_lines[0]
+                root_line = body.splitlines()[0]
+                start = len(body)
 
             # Clean up the root line by removing tree characters
             root = root_line.strip()
             # Remove tree characters from the beginning of the line
-            root = re.sub(r'^[└├│─\s]+', '', root)
-            tree = parent = node = AIHubResponseParser.Node(path=Path(root))
+            root = root.lstrip(_TREE_PREFIX_CHARS)
+            # Node paths are plain strings; drop the trailing slash `tree` puts on directories
+            tree = node = AIHubResponseParser.Node(path=root.rstrip("/") or ".")
+            # Open ancestors from the root down to the current parent. Depth can jump by more
+            # than one level between lines, so this is a stack rather than a list indexed by depth.
+            parents = []
             # Always include the root node in paths
-            paths.append((str(tree.path), False, None, None))
-
-            # Parse lines one by one
-            for idx, line in enumerate(body_lines[1:]):
-                # Skip header lines and notice sections
-                if (line.startswith("The contents are encoded") or
-                    line.startswith("If the following contents") or
-                    line.startswith("Please modify the character") or
-                    line.startswith("=================") or
-                    line.startswith("==========================================") or
-                    line.strip().lower().startswith("utf-8") or
-                    line.strip().lower().startswith("output normally") or
-                    line.strip().lower().startswith("modify the character information") or
-                        line.strip() == ""):
-                    continue
-                # Split the tree formatting prefix and the path for lines like:
-                # │   │       │   ├─ filename.zip | 11 MB | 69412
-                # │   │       │   ├── filename.zip | 11 MB | 69412 (test format)
-                # Updated regex to handle additional dashes after tree characters
-                match = re.match(r"(.*?)(└─+|├─+)\s*(.*)", line)
-                if match is None:
-                    continue
-                prefix, tree_char, path = match.groups()
+            paths_append((tree.path, False, None, None))
+
+            # Scan every tree entry after the root line in one pass over the buffer. Header
+            # and notice lines never carry a tree connector, so they simply don't match.
+            for match in _TREE_LINE_RE.finditer(body, start):
+                prefix, path = match.groups()
                 # Deteministic leaf node
                 file_display_size = None
                 file_min_possible_size = None
                 file_max_possible_size = None
                 file_key = None
                 if "|" in path:
-                    # Updated regex: allow optional spaces around | and between number/unit
-                    data_match = re.match(r"(.*)\s*\|\s*(\d+(?:\.\d+)?\s*[KMGT]?B)\s*\|\s*(\d+)", path)
-                    if data_match is None:
-                        continue
-                    path, size_iec, file_key = data_match.groups()
-                    size_match = re.match(r"(\d+(?:\.\d+)?)\s*([KMGT]?)B", size_iec)
-                    if size_match is None:
+                    # Peel "name | size | key" off from the right; spaces around | are optional
+                    rest, _, file_key = path.rpartition("|")
+                    path, _, size_iec = rest.rpartition("|")
+                    file_key = file_key.strip()
+                    size_match = _FILE_SIZE_RE.fullmatch(size_iec.strip())
+                    if size_match is None or not file_key.isdecimal():
                         continue
                     size, unit = size_match.groups()
                     size = float(size)
-                    file_display_size = int(size * 1024 ** (" KMGT".index(unit)))
-                    file_min_possible_size = int((size - 0.5) * 1024 ** (" KMGT".index(unit)))
-                    file_max_possible_size = int((size + 1.0) * 1024 ** (" KMGT".index(unit)))
-                path = Path(path.strip())
-                prefix_len = len(prefix)
+                    multiplier = _UNIT_MULTIPLIERS[unit]
+                    file_display_size = int(size * multiplier)
+                    file_min_possible_size = int((size - 0.5) * multiplier)
+                    file_max_possible_size = int((size + 1.0) * multiplier)
+                path = path.strip().rstrip("/") or "."
+                if file_key is None:
+                    # Directory names (train, test, images, ...) repeat across the tree; share one string each
+                    path = sys.intern(path)
                 # Calculate depth based on prefix length
                 depth = 1
                 leading_spaces = len(prefix) - len(prefix.lstrip())
@@ -137,11 +201,11 @@ class AIHubResponseParser:
                     depth = (leading_spaces // 4) + 1
                 # Determine nesting level relative to previous node
                 if depth > node.depth:
-                    parent = node
+                    parents.append(node)
                 elif depth < node.depth:
-                    for _ in range(depth, node.depth):
-                        if parent and parent.parent:
-                            parent = parent.parent
+                    # Close one ancestor per level climbed, but never the root
+                    del parents[max(1, len(parents) - (node.depth - depth)):]
+                parent = parents[-1]
                 # Append to tree at the appropriate level
                 node = AIHubResponseParser.Node(path, parent=parent, depth=depth)
                 if file_key is not None:
@@ -153,10 +217,13 @@ class AIHubResponseParser:
                     parent.children.append(node)
                 # Append full path to list
                 if file_key is not None:
-                    paths.append((str(node.full_path()), True, file_key,
+                    paths_append((node.full_path(), True, file_key,
                                   (file_display_size, file_min_possible_size, file_max_possible_size)))
                 else:
-                    paths.append((str(node.full_path()), False, None, None))
+                    paths_append((node.full_path(), False, None, None))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parsed %d tree entries", len(paths))
             return tree, paths
-        except Exception as e:
+        except Exception:
+            logger.debug("Failed to parse tree output", exc_info=True)
             return None, None
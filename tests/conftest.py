@@ -12,6 +12,7 @@
 # @with Claude Sonnet 4 (Cutoff 2025/06/16)
 
 import os
+import socket
 import tempfile
 from pathlib import Path
 from typing import Dict, Optional
@@ -198,6 +199,36 @@ def mock_api_responses():
         yield rsps
 
 
+@pytest.fixture(scope="class")
+def responses_router():
+    """Install a single responses router shared by every test in a class."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+
+@pytest.fixture
+def shared_responses(responses_router):
+    """Provide the class-wide responses router, clearing registered mocks after each test."""
+    yield responses_router
+    responses_router.reset()
+
+
+@pytest.fixture
+def mocked_responses():
+    """Install a responses router for a single test only."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+
+@pytest.fixture(scope="session")
+def api_reachable():
+    """Skip real API tests up front when the AIHub API host cannot be reached."""
+    try:
+        socket.create_connection(("api.aihub.or.kr", 443), timeout=2).close()
+    except OSError:
+        pytest.skip("AIHub API unreachable")
+
+
 @pytest.fixture
 def test_api_key():
     """Provide a test API key."""
@@ -22,32 +22,43 @@ from src.aihubkr.core.auth import AIHubAuth
 from src.aihubkr.core.config import AIHubConfig
 
 
+@pytest.fixture(scope="class")
+def auth_factory():
+    """Build AIHubAuth instances for the tests in a class."""
+    return lambda api_key=None: AIHubAuth(api_key)
+
+
 class TestAIHubAuth:
     """Test cases for AIHub authentication module."""
 
-    def test_init_with_api_key(self):
+    @pytest.fixture(autouse=True)
+    def _mock(self, shared_responses):
+        """Expose the shared responses router to each test."""
+        self.rsps = shared_responses
+
+    def test_init_with_api_key(self, auth_factory):
         """Test initialization with API key."""
         api_key = "test-api-key-12345"
-        auth = AIHubAuth(api_key)
+        auth = auth_factory(api_key)
         assert auth.api_key == api_key
         assert auth.autosave_enabled is False
 
-    def test_init_without_api_key(self):
+    def test_init_without_api_key(self, auth_factory):
         """Test initialization without API key."""
-        auth = AIHubAuth()
+        auth = auth_factory()
         assert auth.api_key is None
         assert auth.autosave_enabled is False
 
-    def test_set_api_key(self):
+    def test_set_api_key(self, auth_factory):
         """Test setting API key."""
-        auth = AIHubAuth()
+        auth = auth_factory()
         api_key = "new-api-key-67890"
         auth.set_api_key(api_key)
         assert auth.api_key == api_key
 
-    def test_set_api_key_with_autosave(self):
+    def test_set_api_key_with_autosave(self, auth_factory):
         """Test setting API key with autosave enabled."""
-        auth = AIHubAuth()
+        auth = auth_factory()
         auth.autosave_enabled = True
 
         with patch.object(auth, 'save_credential') as mock_save:
@@ -55,24 +66,23 @@ class TestAIHubAuth:
             auth.set_api_key(api_key)
             mock_save.assert_called_once()
 
-    def test_get_auth_headers_with_api_key(self):
+    def test_get_auth_headers_with_api_key(self, auth_factory):
         """Test getting authentication headers with API key."""
         api_key = "test-api-key-12345"
-        auth = AIHubAuth(api_key)
+        auth = auth_factory(api_key)
         headers = auth.get_auth_headers()
         assert headers == {"apikey": api_key}
 
-    def test_get_auth_headers_without_api_key(self):
+    def test_get_auth_headers_without_api_key(self, auth_factory):
         """Test getting authentication headers without API key."""
-        auth = AIHubAuth()
+        auth = auth_factory()
         headers = auth.get_auth_headers()
         assert headers is None
 
-    @responses.activate
-    def test_validate_api_key_always_fails_with_502(self):
+    def test_validate_api_key_always_fails_with_502(self, auth_factory):
         """Test API key validation always fails with HTTP 502 response (real API behavior)."""
         # Mock the API key validation endpoint with real failure message
-        responses.add(
+        self.rsps.add(
             responses.GET,
             "https://api.aihub.or.kr/down/0.5/-1.do",
             body="요청하신 데이터셋의 파일이 존재하지 않습니다. 파일의 존재여부 및 자세한 사항은 홈페이지(https://aihub.or.kr)에서 확인 바랍니다.",
@@ -80,16 +90,15 @@ class TestAIHubAuth:
             content_type="text/plain"
         )
 
-        auth = AIHubAuth("valid-api-key")
+        auth = auth_factory("valid-api-key")
         result = auth.validate_api_key()
         # The validation endpoint always returns failure, even with valid API keys
         assert result is False
 
-    @responses.activate
-    def test_validate_api_key_failure_with_502(self):
+    def test_validate_api_key_failure_with_502(self, auth_factory):
         """Test API key validation failure with HTTP 502 response."""
         # Mock the API key validation endpoint with real failure message
-        responses.add(
+        self.rsps.add(
             responses.GET,
             "https://api.aihub.or.kr/down/0.5/-1.do",
             body="요청하신 데이터셋의 파일이 존재하지 않습니다. 파일의 존재여부 및 자세한 사항은 홈페이지(https://aihub.or.kr)에서 확인 바랍니다.",
@@ -97,15 +106,14 @@ class TestAIHubAuth:
             content_type="text/plain"
         )
 
-        auth = AIHubAuth("invalid-api-key")
+        auth = auth_factory("invalid-api-key")
         result = auth.validate_api_key()
         assert result is False
 
-    @responses.activate
-    def test_validate_api_key_unknown_response(self):
+    def test_validate_api_key_unknown_response(self, auth_factory):
         """Test API key validation with unknown response content."""
         # Mock the API key validation endpoint
-        responses.add(
+        self.rsps.add(
             responses.GET,
             "https://api.aihub.or.kr/down/0.5/-1.do",
             body="알 수 없는 응답입니다.",
@@ -113,68 +121,66 @@ class TestAIHubAuth:
             content_type="text/plain"
         )
 
-        auth = AIHubAuth("unknown-api-key")
+        auth = auth_factory("unknown-api-key")
         result = auth.validate_api_key()
         assert result is False
 
-    @responses.activate
-    def test_validate_api_key_timeout(self):
+    def test_validate_api_key_timeout(self, auth_factory):
         """Test API key validation with timeout."""
         # Mock the API key validation endpoint to timeout
-        responses.add(
+        self.rsps.add(
             responses.GET,
             "https://api.aihub.or.kr/down/0.5/-1.do",
             body=requests.Timeout("Request timed out"),
             status=408
         )
 
-        auth = AIHubAuth("timeout-api-key")
+        auth = auth_factory("timeout-api-key")
         result = auth.validate_api_key()
         assert result is False
 
-    @responses.activate
-    def test_validate_api_key_network_error(self):
+    def test_validate_api_key_network_error(self, auth_factory):
         """Test API key validation with network error."""
         # Mock the API key validation endpoint to fail
-        responses.add(
+        self.rsps.add(
             responses.GET,
             "https://api.aihub.or.kr/down/0.5/-1.do",
             body=requests.ConnectionError("Connection failed"),
             status=500
         )
 
-        auth = AIHubAuth("network-error-api-key")
+        auth = auth_factory("network-error-api-key")
         result = auth.validate_api_key()
         assert result is False
 
-    def test_validate_api_key_without_key(self):
+    def test_validate_api_key_without_key(self, auth_factory):
         """Test API key validation without API key."""
-        auth = AIHubAuth()
+        auth = auth_factory()
         result = auth.validate_api_key()
         assert result is False
 
     @patch.object(AIHubConfig, 'get_instance')
-    def test_save_credential(self, mock_config_instance):
+    def test_save_credential(self, mock_config_instance, auth_factory):
         """Test saving API key credentials."""
         mock_config = Mock()
         mock_config.config_db = {}
         mock_config_instance.return_value = mock_config
 
-        auth = AIHubAuth("test-api-key")
+        auth = auth_factory("test-api-key")
         auth.save_credential()
 
         assert mock_config.config_db["api_key"] == "test-api-key"
         assert mock_config.config_db["version"] == "2"
         mock_config.save_to_disk.assert_called_once()
 
-    def test_save_credential_without_api_key(self):
+    def test_save_credential_without_api_key(self, auth_factory):
         """Test saving credentials without API key."""
-        auth = AIHubAuth()
+        auth = auth_factory()
         # Should not raise an exception
         auth.save_credential()
 
     @patch.object(AIHubConfig, 'get_instance')
-    def test_load_credentials_success(self, mock_config_instance):
+    def test_load_credentials_success(self, mock_config_instance, auth_factory):
         """Test loading credentials successfully."""
         mock_config = Mock()
         mock_config.config_db = {
@@ -183,7 +189,7 @@ class TestAIHubAuth:
         }
         mock_config_instance.return_value = mock_config
 
-        auth = AIHubAuth()
+        auth = auth_factory()
         result = auth.load_credentials()
 
         assert result == "saved-api-key"
@@ -191,7 +197,7 @@ class TestAIHubAuth:
         assert auth.autosave_enabled is True
 
     @patch.object(AIHubConfig, 'get_instance')
-    def test_load_credentials_outdated_version(self, mock_config_instance):
+    def test_load_credentials_outdated_version(self, mock_config_instance, auth_factory):
         """Test loading credentials with outdated version."""
         mock_config = Mock()
         mock_config.config_db = {
@@ -202,7 +208,7 @@ class TestAIHubAuth:
         mock_config.load_from_disk = Mock()
         mock_config_instance.return_value = mock_config
 
-        auth = AIHubAuth()
+        auth = auth_factory()
         result = auth.load_credentials()
 
         assert result is None
@@ -214,13 +220,13 @@ class TestAIHubAuth:
         mock_config.save_to_disk.assert_called_once()
 
     @patch.object(AIHubConfig, 'get_instance')
-    def test_load_credentials_no_saved_key(self, mock_config_instance):
+    def test_load_credentials_no_saved_key(self, mock_config_instance, auth_factory):
         """Test loading credentials when no key is saved."""
         mock_config = Mock()
         mock_config.config_db = {}
         mock_config_instance.return_value = mock_config
 
-        auth = AIHubAuth()
+        auth = auth_factory()
         result = auth.load_credentials()
 
         assert result is None
@@ -228,7 +234,7 @@ class TestAIHubAuth:
         assert auth.autosave_enabled is False
 
     @patch.object(AIHubConfig, 'get_instance')
-    def test_clear_credential(self, mock_config_instance):
+    def test_clear_credential(self, mock_config_instance, auth_factory):
         """Test clearing stored credentials."""
         mock_config = Mock()
         mock_config.config_db = {
@@ -239,7 +245,7 @@ class TestAIHubAuth:
         mock_config.load_from_disk = Mock()
         mock_config_instance.return_value = mock_config
 
-        auth = AIHubAuth("test-api-key")
+        auth = auth_factory("test-api-key")
         auth.autosave_enabled = True
         auth.clear_credential()
 
@@ -256,9 +262,9 @@ class TestAIHubAuthIntegration:
 
     @pytest.mark.integration
     @pytest.mark.auth
-    def test_full_authentication_flow(self):
+    def test_full_authentication_flow(self, auth_factory):
         """Test complete authentication flow."""
-        auth = AIHubAuth()
+        auth = auth_factory()
 
         # Test setting API key
         api_key = "integration-test-key"
@@ -276,7 +282,7 @@ class TestAIHubAuthIntegration:
 
     @pytest.mark.api
     @pytest.mark.slow
-    def test_real_api_key_validation(self):
+    def test_real_api_key_validation(self, auth_factory):
         """Test with real API key validation (marked as slow)."""
         # This test requires a real API key and internet connection
         # It's marked as slow and should be run separately
@@ -284,7 +290,7 @@ class TestAIHubAuthIntegration:
         if not api_key:
             pytest.skip("AIHUB_TEST_API_KEY environment variable not set")
 
-        auth = AIHubAuth(api_key)
+        auth = auth_factory(api_key)
         result = auth.validate_api_key()
 
         # Should return a boolean (True for valid, False for invalid)
@@ -7,15 +7,20 @@
 # - Validates CLI output formatting
 # - Tests error handling and user feedback
 # - Mocks API interactions for controlled testing
+# - Tests share no mutable state and can run in parallel: pytest -n auto tests/test_cli.py
 #
 # @author Jung-In An <ji5489@gmail.com>
 # @with Claude Sonnet 4 (Cutoff 2025/06/16)
 
 import sys
-from io import StringIO
-from unittest.mock import Mock, patch
+import tarfile
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Tuple
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+import requests
 
 from src.aihubkr.cli.main import (
     download_dataset,
@@ -25,91 +30,136 @@ from src.aihubkr.cli.main import (
     parse_arguments,
     print_usage
 )
+from src.aihubkr.core.downloader import DownloadStatus
+
+_SUCCESS, _AUTH_ERR = DownloadStatus.SUCCESS, DownloadStatus.AUTHENTICATION_ERROR
+
+
+# Immutable payloads shared by the CLI tests
+SAMPLE_DATASETS = (
+    ("001", "한국어 대화 데이터셋"),
+    ("002", "이미지 분류 데이터셋"),
+)
+
+SAMPLE_FILE_TREE = """dataset_001
+├── README.txt | 1.5KB | 1
+└── data.txt | 2.3MB | 2"""
+
+SAMPLE_PATHS = (
+    ("dataset_001/README.txt", True, "1", (1536, 1024, 2048)),
+    ("dataset_001/data.txt", True, "2", (2411724, 2097152, 2621440)),
+)
+
+
+@pytest.fixture(scope="module")
+def sample_datasets():
+    """Dataset list returned by a successful dataset info request."""
+    return SAMPLE_DATASETS
+
+
+@pytest.fixture(scope="module")
+def sample_file_tree():
+    """Raw file tree body for a two-file dataset."""
+    return SAMPLE_FILE_TREE
+
+
+@pytest.fixture(scope="module")
+def sample_paths():
+    """Parsed paths matching `SAMPLE_FILE_TREE`."""
+    return SAMPLE_PATHS
+
+
+@pytest.fixture
+def mock_downloader_cls(monkeypatch):
+    """Replace the AIHubDownloader class used by the CLI."""
+    mock = MagicMock()
+    monkeypatch.setattr("src.aihubkr.cli.main.AIHubDownloader", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_auth_cls(monkeypatch):
+    """Replace the AIHubAuth class used by the CLI."""
+    mock = MagicMock()
+    monkeypatch.setattr("src.aihubkr.cli.main.AIHubAuth", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_parser_cls(monkeypatch):
+    """Replace the AIHubResponseParser class used by the CLI."""
+    mock = MagicMock()
+    monkeypatch.setattr("src.aihubkr.cli.main.AIHubResponseParser", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_parse_args(monkeypatch):
+    """Replace the CLI argument parser."""
+    mock = MagicMock()
+    monkeypatch.setattr("src.aihubkr.cli.main.parse_arguments", mock)
+    return mock
+
+
+PARSE_ARGUMENTS_CASES = [
+    # (argv, expected subset of parsed arguments, expected exception)
+    (["aihubkr-dl", "list"], {"command": "list", "output_dir": "."}, None),
+    (["aihubkr-dl", "files", "001"], {"command": "files", "dataset_key": "001"}, None),
+    (["aihubkr-dl", "download", "001"],
+     {"command": "download", "dataset_key": "001", "file_key": "all", "output_dir": "."}, None),
+    (["aihubkr-dl", "download", "001", "--file-key", "1,2,3"],
+     {"command": "download", "dataset_key": "001", "file_key": "1,2,3"}, None),
+    (["aihubkr-dl", "--output-dir", "/tmp/test", "download", "001"],
+     {"command": "download", "dataset_key": "001", "output_dir": "/tmp/test"}, None),
+    (["aihubkr-dl", "--api-key", "test-key", "list"], {"command": "list", "api_key": "test-key"}, None),
+    (["aihubkr-dl", "help"], {"command": "help"}, None),
+    (["aihubkr-dl"], None, SystemExit),  # No command should show help and exit
+]
 
 
 class TestCLIArgumentParsing:
     """Test cases for CLI argument parsing."""
 
-    def test_parse_arguments_list_command(self):
-        """Test parsing list command arguments."""
-        with patch.object(sys, 'argv', ['aihubkr-dl', 'list']):
-            args = parse_arguments()
-            assert args['command'] == 'list'
-            assert args['output_dir'] == '.'
-
-    def test_parse_arguments_files_command(self):
-        """Test parsing files command arguments."""
-        with patch.object(sys, 'argv', ['aihubkr-dl', 'files', '001']):
-            args = parse_arguments()
-            assert args['command'] == 'files'
-            assert args['dataset_key'] == '001'
-
-    def test_parse_arguments_download_command(self):
-        """Test parsing download command arguments."""
-        with patch.object(sys, 'argv', ['aihubkr-dl', 'download', '001']):
-            args = parse_arguments()
-            assert args['command'] == 'download'
-            assert args['dataset_key'] == '001'
-            assert args['file_key'] == 'all'
-            assert args['output_dir'] == '.'
-
-    def test_parse_arguments_download_with_file_keys(self):
-        """Test parsing download command with specific file keys."""
-        with patch.object(sys, 'argv', ['aihubkr-dl', 'download', '001', '--file-key', '1,2,3']):
-            args = parse_arguments()
-            assert args['command'] == 'download'
-            assert args['dataset_key'] == '001'
-            assert args['file_key'] == '1,2,3'
-
-    def test_parse_arguments_download_with_output_dir(self):
-        """Test parsing download command with custom output directory."""
-        with patch.object(sys, 'argv', ['aihubkr-dl', '--output-dir', '/tmp/test', 'download', '001']):
-            args = parse_arguments()
-            assert args['command'] == 'download'
-            assert args['dataset_key'] == '001'
-            assert args['output_dir'] == '/tmp/test'
-
-    def test_parse_arguments_with_api_key(self):
-        """Test parsing arguments with API key."""
-        with patch.object(sys, 'argv', ['aihubkr-dl', '--api-key', 'test-key', 'list']):
-            args = parse_arguments()
-            assert args['command'] == 'list'
-            assert args['api_key'] == 'test-key'
-
-    def test_parse_arguments_help_command(self):
-        """Test parsing help command arguments."""
-        with patch.object(sys, 'argv', ['aihubkr-dl', 'help']):
-            args = parse_arguments()
-            assert args['command'] == 'help'
-
-    def test_parse_arguments_no_command(self):
-        """Test parsing arguments with no command (should show help)."""
-        with patch.object(sys, 'argv', ['aihubkr-dl']):
-            with pytest.raises(SystemExit):
+    @pytest.mark.parametrize(
+        "argv, expected, raises",
+        PARSE_ARGUMENTS_CASES,
+        ids=[
+            "list_command",
+            "files_command",
+            "download_command",
+            "download_with_file_keys",
+            "download_with_output_dir",
+            "with_api_key",
+            "help_command",
+            "no_command",
+        ],
+    )
+    def test_parse_arguments(self, monkeypatch, argv, expected, raises):
+        """Test parsing CLI arguments for each subcommand and global option."""
+        monkeypatch.setattr(sys, "argv", argv)
+        if raises is not None:
+            with pytest.raises(raises):
                 parse_arguments()
+            return
+
+        args = parse_arguments()
+        assert expected.items() <= args.items()
 
 
 class TestCLIFunctions:
     """Test cases for CLI functions."""
 
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    def test_list_datasets_success(self, mock_downloader_class):
+    def test_list_datasets_success(self, sample_datasets, capsys):
         """Test successful dataset listing."""
-        # Mock downloader
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
-
-        # Mock dataset data
-        datasets = [
-            ("001", "한국어 대화 데이터셋"),
-            ("002", "이미지 분류 데이터셋")
-        ]
-        mock_downloader.get_dataset_info.return_value = datasets
+        # Stub downloader with dataset data
+        downloader = SimpleNamespace(
+            get_dataset_info=lambda: sample_datasets,
+            export_dataset_list_to_csv=lambda datasets, filename: None,
+        )
 
         # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            list_datasets(mock_downloader)
-            output = mock_stdout.getvalue()
+        list_datasets(downloader)
+        output = capsys.readouterr().out
 
         # Verify output contains dataset information
         assert "001" in output
@@ -118,53 +168,29 @@ class TestCLIFunctions:
         assert "이미지 분류 데이터셋" in output
         assert "aihub_datasets.csv" in output
 
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    def test_list_datasets_failure(self, mock_downloader_class):
+    def test_list_datasets_failure(self, capsys):
         """Test dataset listing failure."""
-        # Mock downloader
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
-
-        # Mock failure
-        mock_downloader.get_dataset_info.return_value = None
+        # Stub downloader failure
+        downloader = SimpleNamespace(get_dataset_info=lambda: None)
 
         # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            list_datasets(mock_downloader)
-            output = mock_stdout.getvalue()
+        list_datasets(downloader)
+        output = capsys.readouterr().out
 
         # Verify error message
         assert "Failed to fetch dataset information" in output
 
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    @patch('src.aihubkr.cli.main.AIHubResponseParser')
-    def test_list_file_tree_success(self, mock_parser_class, mock_downloader_class):
+    def test_list_file_tree_success(self, mock_parser_cls, sample_file_tree, sample_paths, capsys):
         """Test successful file tree listing."""
-        # Mock downloader
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
+        # Stub downloader with file tree data
+        downloader = SimpleNamespace(get_file_tree=lambda dataset_key: (sample_file_tree, None))
 
-        # Mock file tree data
-        file_tree = """dataset_001
-├── README.txt | 1.5KB | 1
-└── data.txt | 2.3MB | 2"""
-        mock_downloader.get_file_tree.return_value = (file_tree, None)
-
-        # Mock parser
-        mock_parser = Mock()
-        mock_parser_class.return_value = mock_parser
-
-        # Mock parsed paths
-        paths = [
-            ("dataset_001/README.txt", True, "1", (1536, 1024, 2048)),
-            ("dataset_001/data.txt", True, "2", (2411724, 2097152, 2621440))
-        ]
-        mock_parser.parse_tree_output.return_value = (Mock(), paths)
+        # Stub parser with parsed paths
+        mock_parser_cls.return_value = SimpleNamespace(parse_tree_output=lambda body: (object(), sample_paths))
 
         # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            list_file_tree(mock_downloader, "001")
-            output = mock_stdout.getvalue()
+        list_file_tree(downloader, "001")
+        output = capsys.readouterr().out
 
         # Verify output contains file information
         assert "README.txt" in output
@@ -172,236 +198,173 @@ class TestCLIFunctions:
         assert "1KiB" in output  # Updated to match actual output format
         assert "2MiB" in output  # Updated to match actual output format
 
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    def test_list_file_tree_failure(self, mock_downloader_class):
+    def test_list_file_tree_failure(self, capsys):
         """Test file tree listing failure."""
-        # Mock downloader
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
-
-        # Mock failure
-        mock_downloader.get_file_tree.return_value = (None, "Failed to fetch file tree.")
+        # Stub downloader failure
+        downloader = SimpleNamespace(get_file_tree=lambda dataset_key: (None, "Failed to fetch file tree."))
 
         # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            list_file_tree(mock_downloader, "001")
-            output = mock_stdout.getvalue()
+        list_file_tree(downloader, "001")
+        output = capsys.readouterr().out
 
         # Verify error message
         assert "Failed to fetch file tree" in output
 
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    def test_list_file_tree_no_files(self, mock_downloader_class):
+    def test_list_file_tree_no_files(self, mock_parser_cls, capsys):
         """Test file tree listing with no files."""
-        # Mock downloader
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
-
-        # Mock file tree data
-        file_tree = "dataset_001"
-        mock_downloader.get_file_tree.return_value = (file_tree, None)
-
-        # Mock parser
-        with patch('src.aihubkr.cli.main.AIHubResponseParser') as mock_parser_class:
-            mock_parser = Mock()
-            mock_parser_class.return_value = mock_parser
-            mock_parser.parse_tree_output.return_value = (Mock(), [])
-
-            # Capture output
-            with patch('sys.stdout', new=StringIO()) as mock_stdout:
-                list_file_tree(mock_downloader, "001")
-                output = mock_stdout.getvalue()
-
-            # Verify message
-            assert "No files found" in output
-
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    def test_download_dataset_success(self, mock_downloader_class):
-        """Test successful dataset download."""
-        # Mock downloader
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
-
-        # Mock successful download
-        from src.aihubkr.core.downloader import DownloadStatus
-        mock_downloader.download_and_process_dataset.return_value = DownloadStatus.SUCCESS
-
-        # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            download_dataset(mock_downloader, "001", "all", ".")
-            output = mock_stdout.getvalue()
-
-        # Verify output
-        assert "Downloading dataset: 001" in output
-        assert "File keys: all" in output
-        assert "Output directory: ." in output
+        # Stub downloader with file tree data
+        downloader = SimpleNamespace(get_file_tree=lambda dataset_key: ("dataset_001", None))
 
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    def test_download_dataset_failure(self, mock_downloader_class):
-        """Test dataset download failure."""
-        # Mock downloader
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
+        # Stub parser with no paths
+        mock_parser_cls.return_value = SimpleNamespace(parse_tree_output=lambda body: (object(), []))
 
-        # Mock failed download
-        from src.aihubkr.core.downloader import DownloadStatus
-        mock_downloader.download_and_process_dataset.return_value = DownloadStatus.AUTHENTICATION_ERROR
+        # Capture output
+        list_file_tree(downloader, "001")
+        output = capsys.readouterr().out
+
+        # Verify message
+        assert "No files found" in output
+
+    @pytest.mark.parametrize(
+        "status, expected",
+        [(_SUCCESS, "Merging completed."), (_AUTH_ERR, "Please check your API key")],
+        ids=["SUCCESS", "AUTHENTICATION_ERROR"],
+    )
+    def test_download_dataset(self, status, expected, mock_parser_cls, tmp_path, capsys):
+        """Test dataset download reports the outcome of successful and failed downloads."""
+        # Stub parser with one file and a downloader returning the download outcome
+        paths = [("dataset_001/test.txt", True, "1", (1024, 512, 1536))]
+        mock_parser_cls.return_value = SimpleNamespace(parse_tree_output=lambda body: (object(), paths))
+        downloader = SimpleNamespace(
+            get_file_tree=lambda dataset_key: ("dataset_001\n└── test.txt | 1KB | 1", None),
+            download_dataset_with_size_check=lambda *args, **kwargs: status,
+        )
+
+        # A successful download leaves an archive behind for the CLI to extract
+        if status is _SUCCESS:
+            tarfile.open(tmp_path / "download.tar", "w").close()
 
         # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            download_dataset(mock_downloader, "001", "all", ".")
-            output = mock_stdout.getvalue()
+        download_dataset(downloader, "001", "all", str(tmp_path))
+        output = capsys.readouterr().out
 
-        # Verify output contains download information
+        # Verify output contains download information and the outcome
         assert "Downloading dataset: 001" in output
+        assert "File keys: all" in output
+        assert f"Output directory: {tmp_path}" in output
+        assert status.get_message() in output
+        assert expected in output
 
-    @patch('requests.get')
-    def test_print_usage_success(self, mock_get):
+    def test_print_usage_success(self, monkeypatch, capsys):
         """Test successful usage information printing."""
-        # Mock successful API response
-        mock_response = Mock()
-        mock_response.text = "AIHub API Usage Information\n\nAvailable endpoints:\n- /info/dataset.do\n- /down/0.5/{key}"
-        mock_get.return_value = mock_response
+        # Fake successful API response
+        usage = "AIHub API Usage Information\n\nAvailable endpoints:\n- /info/dataset.do\n- /down/0.5/{key}"
+        monkeypatch.setattr(requests, "get", lambda *args, **kwargs: SimpleNamespace(text=usage))
 
         # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            print_usage()
-            output = mock_stdout.getvalue()
+        print_usage()
+        output = capsys.readouterr().out
 
         # Verify output
         assert "AIHub API Usage Information" in output
         assert "Available endpoints" in output
 
-    @patch('requests.get')
-    def test_print_usage_failure(self, mock_get):
+    def test_print_usage_failure(self, monkeypatch, capsys):
         """Test usage information printing failure."""
-        # Mock failed API response
-        mock_get.side_effect = Exception("Network error")
+        # Fake failed API request
+        def _raise(*args, **kwargs):
+            raise Exception("Network error")
+
+        monkeypatch.setattr(requests, "get", _raise)
 
         # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            print_usage()
-            output = mock_stdout.getvalue()
+        print_usage()
+        output = capsys.readouterr().out
 
         # Verify error message
         assert "Failed to fetch usage information" in output
         assert "https://api.aihub.or.kr/info/api.do" in output
 
 
-class TestCLIMainFunction:
-    """Test cases for main CLI function."""
-
-    @patch('src.aihubkr.cli.main.parse_arguments')
-    @patch('src.aihubkr.cli.main.AIHubAuth')
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    def test_main_list_command(self, mock_downloader_class, mock_auth_class, mock_parse_args):
-        """Test main function with list command."""
-        # Mock arguments
-        mock_parse_args.return_value = {
-            'command': 'list',
-            'api_key': 'test-key',
-            'output_dir': '.'
-        }
-
-        # Mock auth
-        mock_auth = Mock()
-        mock_auth_class.return_value = mock_auth
-        mock_auth.get_auth_headers.return_value = {'apikey': 'test-key'}
-
-        # Mock downloader
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
-
-        # Mock dataset data
-        datasets = [("001", "Test Dataset")]
-        mock_downloader.get_dataset_info.return_value = datasets
-
-        # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            main()
-            output = mock_stdout.getvalue()
-
-        # Verify output
-        assert "001" in output
-        assert "Test Dataset" in output
-
-    @patch('src.aihubkr.cli.main.parse_arguments')
-    @patch('src.aihubkr.cli.main.AIHubAuth')
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    def test_main_files_command(self, mock_downloader_class, mock_auth_class, mock_parse_args):
-        """Test main function with files command."""
-        # Mock arguments
-        mock_parse_args.return_value = {
-            'command': 'files',
-            'dataset_key': '001',
-            'api_key': 'test-key',
-            'output_dir': '.'
-        }
+@dataclass
+class MainScenario:
+    """A `main()` run: parsed arguments, collaborator setup and expected output."""
+    args: Dict[str, Any]
+    expected_output: Tuple[str, ...]
+    setup: Callable[[Mock, Mock], None] = lambda downloader, parser: None
+    auth_headers: Optional[Dict[str, str]] = field(default_factory=lambda: {'apikey': 'test-key'})
+
+
+def _setup_list_command(downloader, parser):
+    downloader.get_dataset_info.return_value = [("001", "Test Dataset")]
+
+
+def _setup_files_command(downloader, parser):
+    downloader.get_file_tree.return_value = ("dataset_001\n└── test.txt | 1KB | 1", None)
+    paths = [("dataset_001/test.txt", True, "1", (1024, 512, 1536))]
+    parser.parse_tree_output.return_value = (object(), paths)
+
+
+def _setup_download_command(downloader, parser):
+    paths = [("dataset_001/test.txt", True, "1", (1024, 512, 1536))]
+    parser.parse_tree_output.return_value = (object(), paths)
+    # A failed download skips extraction, so nothing is written to the output directory
+    downloader.download_dataset_with_size_check.return_value = _AUTH_ERR
+
+
+MAIN_SCENARIOS = [
+    pytest.param(
+        MainScenario(
+            args={'command': 'list', 'api_key': 'test-key', 'output_dir': '.'},
+            expected_output=("001", "Test Dataset"),
+            setup=_setup_list_command,
+        ),
+        id="list_command",
+    ),
+    pytest.param(
+        MainScenario(
+            args={'command': 'files', 'dataset_key': '001', 'api_key': 'test-key', 'output_dir': '.'},
+            expected_output=("test.txt",),
+            setup=_setup_files_command,
+        ),
+        id="files_command",
+    ),
+    pytest.param(
+        MainScenario(
+            args={'command': 'download', 'dataset_key': '001', 'file_key': 'all', 'output_dir': '.',
+                  'api_key': 'test-key'},
+            expected_output=("Downloading dataset: 001", _AUTH_ERR.get_message()),
+            setup=_setup_download_command,
+        ),
+        id="download_command",
+    ),
+    pytest.param(
+        MainScenario(
+            args={'command': 'list', 'api_key': None, 'output_dir': '.'},
+            expected_output=("Failed to get authentication headers",),
+            auth_headers=None,
+        ),
+        id="no_auth_headers",
+    ),
+]
 
-        # Mock auth
-        mock_auth = Mock()
-        mock_auth_class.return_value = mock_auth
-        mock_auth.get_auth_headers.return_value = {'apikey': 'test-key'}
-
-        # Mock downloader
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
-
-        # Mock file tree data
-        file_tree = "dataset_001\n└── test.txt | 1KB | 1"
-        mock_downloader.get_file_tree.return_value = (file_tree, None)
-
-        # Mock parser
-        with patch('src.aihubkr.cli.main.AIHubResponseParser') as mock_parser_class:
-            mock_parser = Mock()
-            mock_parser_class.return_value = mock_parser
-            paths = [("dataset_001/test.txt", True, "1", (1024, 512, 1536))]
-            mock_parser.parse_tree_output.return_value = (Mock(), paths)
-
-            # Capture output
-            with patch('sys.stdout', new=StringIO()) as mock_stdout:
-                main()
-                output = mock_stdout.getvalue()
-
-            # Verify output
-            assert "test.txt" in output
-
-    @patch('src.aihubkr.cli.main.parse_arguments')
-    @patch('src.aihubkr.cli.main.AIHubAuth')
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    def test_main_download_command(self, mock_downloader_class, mock_auth_class, mock_parse_args):
-        """Test main function with download command."""
-        # Mock arguments
-        mock_parse_args.return_value = {
-            'command': 'download',
-            'dataset_key': '001',
-            'file_key': 'all',
-            'output_dir': '.',
-            'api_key': 'test-key'
-        }
 
-        # Mock auth
-        mock_auth = Mock()
-        mock_auth_class.return_value = mock_auth
-        mock_auth.get_auth_headers.return_value = {'apikey': 'test-key'}
+class TestCLIMainFunction:
+    """Test cases for main CLI function."""
 
-        # Mock downloader
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
+    @pytest.mark.parametrize("scenario", MAIN_SCENARIOS)
+    def test_main(self, scenario, mock_downloader_cls, mock_auth_cls, mock_parser_cls, mock_parse_args, capsys):
+        """Test main function dispatch for each command."""
+        mock_parse_args.return_value = scenario.args
+        mock_auth_cls.return_value.get_auth_headers.return_value = scenario.auth_headers
+        scenario.setup(mock_downloader_cls.return_value, mock_parser_cls.return_value)
 
-        # Mock successful download
-        from src.aihubkr.core.downloader import DownloadStatus
-        mock_downloader.download_and_process_dataset.return_value = DownloadStatus.SUCCESS
+        main()
+        output = capsys.readouterr().out
 
-        # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            main()
-            output = mock_stdout.getvalue()
-
-        # Verify output
-        assert "Downloading dataset: 001" in output
+        for expected in scenario.expected_output:
+            assert expected in output
 
-    @patch('src.aihubkr.cli.main.parse_arguments')
     def test_main_help_command(self, mock_parse_args):
         """Test main function with help command."""
         # Mock arguments
@@ -414,96 +377,30 @@ class TestCLIMainFunction:
             main()
             mock_print_usage.assert_called_once()
 
-    @patch('src.aihubkr.cli.main.parse_arguments')
-    @patch('src.aihubkr.cli.main.AIHubAuth')
-    def test_main_no_auth_headers(self, mock_auth_class, mock_parse_args):
-        """Test main function when no auth headers are available."""
-        # Mock arguments
-        mock_parse_args.return_value = {
-            'command': 'list',
-            'api_key': None,
-            'output_dir': '.'
-        }
-
-        # Mock auth
-        mock_auth = Mock()
-        mock_auth_class.return_value = mock_auth
-        mock_auth.get_auth_headers.return_value = None
-
-        # Capture output
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            main()
-            output = mock_stdout.getvalue()
-
-        # Verify error message
-        assert "Failed to get authentication headers" in output
-
 
 class TestCLIErrorHandling:
     """Test cases for CLI error handling."""
 
-    @patch('src.aihubkr.cli.main.parse_arguments')
-    def test_main_invalid_command(self, mock_parse_args):
-        """Test main function with invalid command."""
-        # Mock arguments with invalid command
-        mock_parse_args.return_value = {
-            'command': 'invalid_command'
-        }
-
-        # Should handle gracefully
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            main()
-            output = mock_stdout.getvalue()
-
-        # Should not crash
-        assert output is not None
-
-    @patch('src.aihubkr.cli.main.parse_arguments')
-    @patch('src.aihubkr.cli.main.AIHubAuth')
-    def test_main_auth_exception(self, mock_auth_class, mock_parse_args):
-        """Test main function with authentication exception."""
-        # Mock arguments
-        mock_parse_args.return_value = {
-            'command': 'list',
-            'api_key': 'test-key',
-            'output_dir': '.'
-        }
-
-        # Mock auth to raise exception
-        mock_auth_class.side_effect = Exception("Auth error")
-
-        # Should handle gracefully
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            main()
-            output = mock_stdout.getvalue()
-
-        # Should not crash
-        assert output is not None
-
-    @patch('src.aihubkr.cli.main.parse_arguments')
-    @patch('src.aihubkr.cli.main.AIHubAuth')
-    @patch('src.aihubkr.cli.main.AIHubDownloader')
-    def test_main_downloader_exception(self, mock_downloader_class, mock_auth_class, mock_parse_args):
-        """Test main function with downloader exception."""
-        # Mock arguments
+    @pytest.mark.parametrize("break_point", ["invalid_cmd", "auth_raises", "downloader_raises"])
+    def test_main_resilient(self, break_point, mock_parse_args, mock_auth_cls, mock_downloader_cls, capsys):
+        """Test main function handles a misbehaving command or collaborator gracefully."""
         mock_parse_args.return_value = {
             'command': 'list',
             'api_key': 'test-key',
             'output_dir': '.'
         }
+        mock_auth_cls.return_value.get_auth_headers.return_value = {'apikey': 'test-key'}
 
-        # Mock auth
-        mock_auth = Mock()
-        mock_auth_class.return_value = mock_auth
-        mock_auth.get_auth_headers.return_value = {'apikey': 'test-key'}
-
-        # Mock downloader to raise exception
-        mock_downloader_class.side_effect = Exception("Downloader error")
+        if break_point == "invalid_cmd":
+            mock_parse_args.return_value = {'command': 'invalid_command'}
+        elif break_point == "auth_raises":
+            mock_auth_cls.side_effect = Exception("Auth error")
+        elif break_point == "downloader_raises":
+            mock_downloader_cls.side_effect = Exception("Downloader error")
 
         # Should handle gracefully
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            main()
-            output = mock_stdout.getvalue()
+        main()
+        output = capsys.readouterr().out
 
         # Should not crash
         assert output is not None
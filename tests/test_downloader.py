@@ -7,20 +7,90 @@
 # - Validates success/failure based on content analysis
 # - Tests file tree parsing and dataset operations
 # - Mocks API responses for controlled testing
+# - Each test installs its own responses router; run in parallel with: pytest -n auto tests/test_downloader.py
 #
 # @author Jung-In An <ji5489@gmail.com>
 # @with Claude Sonnet 4 (Cutoff 2025/06/16)
 
 import os
-import requests
-from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 import pytest
 import responses
 
 from src.aihubkr.core.downloader import AIHubDownloader, DownloadStatus
 
+# Set up the module-scoped downloader for every test here, including tests that never request it
+pytestmark = pytest.mark.usefixtures("downloader")
+
+
+# Response bodies shared by the tests below, built once at import; bodies served
+# as-is by responses are pre-encoded and registered with UTF8_TEXT
+UTF8_TEXT = "text/plain; charset=utf-8"
+
+NOTICE_BODY = """Content before
+================================================================================
+공지사항
+================================================================================
+Notice content here
+================================================================================
+Content after"""
+
+EMPTY_NOTICE_BODY = """Content before
+================================================================================
+공지사항
+================================================================================
+
+================================================================================
+Content after"""
+
+DATASET_INFO_BODY = """================================================================================
+데이터셋 목록
+================================================================================
+50, AR/VR 화면정확도 향상을 위한 플렌옵틱 카메라 이미지
+51, K-Fashion 이미지
+52, K-pop 안무 영상
+================================================================================
+"""
+
+FILE_TREE_BODY = """UTF-8
+output normally
+modify the character information
+dataset_001
+├── README.txt | 1.5KB | 1
+├── data/
+│   └── train.txt | 2.3MB | 2
+└── metadata.json | 15KB | 3""".encode("utf-8")
+
+FULL_FLOW_DATASET_BODY = """UTF-8
+output normally
+modify the character information
+================================================================================
+데이터셋 목록
+================================================================================
+001,테스트 데이터셋
+================================================================================
+""".encode("utf-8")
+
+FULL_FLOW_TREE_BODY = """UTF-8
+output normally
+modify the character information
+test_dataset
+└── test.txt | 1KB | 1""".encode("utf-8")
+
+FULL_FLOW_DOWNLOAD_BODY = "다운로드가 시작됩니다.".encode("utf-8")
+
+
+def register_dataset_info(rsps, body, status=502, content_type="text/plain"):
+    """Register a dataset info response on the given responses router."""
+    rsps.add(responses.GET, AIHubDownloader.DATASET_URL, body=body, status=status, content_type=content_type)
+
+
+@pytest.fixture(scope="module")
+def downloader():
+    """Shared unauthenticated downloader for tests that only call stateless methods."""
+    return AIHubDownloader()
+
 
 class TestAIHubDownloader:
     """Test cases for AIHub downloader module."""
@@ -36,75 +106,31 @@ class TestAIHubDownloader:
         downloader = AIHubDownloader()
         assert downloader.auth_headers == {}
 
-    def test_process_response_success_200(self):
-        """Test processing successful response with HTTP 200."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = "Success response content"
-
-        downloader = AIHubDownloader()
-        success, content = downloader._process_response(mock_response)
-
-        assert success is True
-        assert content == "Success response content"
-
-    def test_process_response_success_502(self):
-        """Test processing successful response with HTTP 502."""
-        mock_response = Mock()
-        mock_response.status_code = 502
-        mock_response.text = "Success response content"
+    @pytest.mark.parametrize(
+        "status_code, text, expected_success, expected_content",
+        [
+            (200, "Success response content", True, "Success response content"),
+            (502, "Success response content", True, "Success response content"),
+            (404, "Not found", False, None),
+            # UTF-8 header lines are removed from the content
+            (200, "UTF-8\noutput normally\nmodify the character information\nActual content here\nMore content",
+             True, "Actual content here\nMore content"),
+        ],
+        ids=["success_200", "success_502", "failure", "with_utf8_headers"],
+    )
+    def test_process_response(self, downloader, status_code, text, expected_success, expected_content):
+        """Test processing responses by status code and content."""
+        mock_response = SimpleNamespace(status_code=status_code, text=text)
 
-        downloader = AIHubDownloader()
         success, content = downloader._process_response(mock_response)
 
-        assert success is True
-        assert content == "Success response content"
-
-    def test_process_response_failure(self):
-        """Test processing failed response."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Not found"
+        assert success is expected_success
+        assert content == expected_content
 
-        downloader = AIHubDownloader()
-        success, content = downloader._process_response(mock_response)
-
-        assert success is False
-        assert content is None
-
-    def test_process_response_with_utf8_headers(self):
-        """Test processing response with UTF-8 headers to remove."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """UTF-8
-output normally
-modify the character information
-Actual content here
-More content"""
-
-        downloader = AIHubDownloader()
-        success, content = downloader._process_response(mock_response)
-
-        assert success is True
-        assert "UTF-8" not in content
-        assert "output normally" not in content
-        assert "modify the character information" not in content
-        assert "Actual content here" in content
-        assert "More content" in content
-
-    def test_process_response_with_notice_section(self):
+    def test_process_response_with_notice_section(self, downloader):
         """Test processing response with notice section formatting."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """Content before
-================================================================================
-공지사항
-================================================================================
-Notice content here
-================================================================================
-Content after"""
+        mock_response = SimpleNamespace(status_code=200, text=NOTICE_BODY)
 
-        downloader = AIHubDownloader()
         success, content = downloader._process_response(mock_response)
 
         assert success is True
@@ -112,19 +138,10 @@ Content after"""
         assert "Content before" in content
         assert "Content after" in content
 
-    def test_process_response_with_empty_notice(self):
+    def test_process_response_with_empty_notice(self, downloader):
         """Test processing response with empty notice section."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """Content before
-================================================================================
-공지사항
-================================================================================
+        mock_response = SimpleNamespace(status_code=200, text=EMPTY_NOTICE_BODY)
 
-================================================================================
-Content after"""
-
-        downloader = AIHubDownloader()
         success, content = downloader._process_response(mock_response)
 
         assert success is True
@@ -132,25 +149,10 @@ Content after"""
         assert "Content before" in content
         assert "Content after" in content
 
-    @responses.activate
-    def test_get_dataset_info_success(self):
+    def test_get_dataset_info_success(self, downloader, mocked_responses):
         """Test successful dataset information retrieval."""
-        responses.add(
-            responses.GET,
-            "https://api.aihub.or.kr/info/dataset.do",
-            body="""================================================================================
-데이터셋 목록
-================================================================================
-50, AR/VR 화면정확도 향상을 위한 플렌옵틱 카메라 이미지
-51, K-Fashion 이미지
-52, K-pop 안무 영상
-================================================================================
-""",
-            status=502,
-            content_type="text/plain;charset=UTF-8"
-        )
+        register_dataset_info(mocked_responses, DATASET_INFO_BODY, content_type="text/plain;charset=UTF-8")
 
-        downloader = AIHubDownloader()
         datasets = downloader.get_dataset_info()
 
         assert datasets is not None
@@ -159,38 +161,25 @@ Content after"""
         assert datasets[1] == ("51", "K-Fashion 이미지")
         assert datasets[2] == ("52", "K-pop 안무 영상")
 
-    @responses.activate
-    def test_get_dataset_info_failure(self):
+    def test_get_dataset_info_failure(self, downloader, mocked_responses):
         """Test failed dataset information retrieval."""
-        responses.add(
-            responses.GET,
-            "https://api.aihub.or.kr/info/dataset.do",
-            body="Error occurred",
-            status=500,
-            content_type="text/plain"
-        )
+        register_dataset_info(mocked_responses, "Error occurred", status=500)
 
-        downloader = AIHubDownloader()
         datasets = downloader.get_dataset_info()
 
         assert datasets is None
 
-    @responses.activate
-    def test_get_dataset_info_timeout(self):
+    def test_get_dataset_info_timeout(self, downloader, mocked_responses):
         """Test dataset information retrieval with timeout."""
-        responses.add(
-            responses.GET,
-            "https://api.aihub.or.kr/info/dataset.do",
-            body=requests.Timeout("Timeout"),
-            status=408
-        )
+        import requests
+
+        register_dataset_info(mocked_responses, requests.Timeout("Timeout"), status=408)
 
-        downloader = AIHubDownloader()
         datasets = downloader.get_dataset_info()
 
         assert datasets is None
 
-    def test_process_dataset_list(self):
+    def test_process_dataset_list(self, downloader):
         """Test processing dataset list content."""
         content = """================================================================================
 데이터셋 목록
@@ -201,7 +190,6 @@ Content after"""
 ================================================================================
 """
 
-        downloader = AIHubDownloader()
         datasets = downloader.process_dataset_list(content)
 
         assert len(datasets) == 3
@@ -209,7 +197,7 @@ Content after"""
         assert datasets[1] == ("002", "이미지 분류 데이터셋")
         assert datasets[2] == ("003", "텍스트 분석 데이터셋")
 
-    def test_process_dataset_list_empty(self):
+    def test_process_dataset_list_empty(self, downloader):
         """Test processing empty dataset list."""
         content = """================================================================================
 데이터셋 목록
@@ -217,30 +205,20 @@ Content after"""
 ================================================================================
 """
 
-        downloader = AIHubDownloader()
         datasets = downloader.process_dataset_list(content)
 
         assert len(datasets) == 0
 
-    @responses.activate
-    def test_get_file_tree_success(self):
+    def test_get_file_tree_success(self, downloader, mocked_responses):
         """Test successful file tree retrieval."""
-        responses.add(
+        mocked_responses.add(
             responses.GET,
             "https://api.aihub.or.kr/info/001.do",
-            body="""UTF-8
-output normally
-modify the character information
-dataset_001
-├── README.txt | 1.5KB | 1
-├── data/
-│   └── train.txt | 2.3MB | 2
-└── metadata.json | 15KB | 3""",
+            body=FILE_TREE_BODY,
             status=200,
-            content_type="text/plain"
+            content_type=UTF8_TEXT
         )
 
-        downloader = AIHubDownloader()
         file_tree, error_message = downloader.get_file_tree("001")
 
         assert error_message is None
@@ -249,10 +227,9 @@ dataset_001
         assert "README.txt" in file_tree
         assert "data/" in file_tree
 
-    @responses.activate
-    def test_get_file_tree_failure(self):
+    def test_get_file_tree_failure(self, downloader, mocked_responses):
         """Test failed file tree retrieval."""
-        responses.add(
+        mocked_responses.add(
             responses.GET,
             "https://api.aihub.or.kr/info/001.do",
             body="Dataset not found",
@@ -260,63 +237,55 @@ dataset_001
             content_type="text/plain"
         )
 
-        downloader = AIHubDownloader()
         file_tree, error_message = downloader.get_file_tree("001")
 
         assert file_tree is None
         assert error_message is not None
 
-    def test_export_dataset_list_to_csv(self, temp_dir):
+    def test_export_dataset_list_to_csv(self, downloader, tmp_path_factory):
         """Test exporting dataset list to CSV."""
         datasets = [
             ("001", "한국어 대화 데이터셋"),
             ("002", "이미지 분류 데이터셋")
         ]
 
-        csv_file = temp_dir / "test_datasets.csv"
-        downloader = AIHubDownloader()
+        # export_dataset_list_to_csv takes a filename, so write into the session temp root
+        csv_file = tmp_path_factory.mktemp("csv") / "test_datasets.csv"
         downloader.export_dataset_list_to_csv(datasets, str(csv_file))
 
-        assert csv_file.exists()
-
         # Read and verify CSV content
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert "ID,Name" in content
-            assert "001,한국어 대화 데이터셋" in content
-            assert "002,이미지 분류 데이터셋" in content
-
-    def test_check_disk_space_sufficient(self, temp_dir):
-        """Test disk space check with sufficient space."""
-        downloader = AIHubDownloader()
-        result = downloader._check_disk_space(1024, str(temp_dir))  # 1KB
-        assert result is True
-
-    def test_check_disk_space_insufficient(self, temp_dir):
-        """Test disk space check with insufficient space."""
-        downloader = AIHubDownloader()
-        # Request more space than available (1TB)
-        result = downloader._check_disk_space(1024 * 1024 * 1024 * 1024, str(temp_dir))
-        assert result is False
-
-    def test_format_size(self):
+        content = csv_file.read_text(encoding="utf-8")
+        assert "ID,Name" in content
+        assert "001,한국어 대화 데이터셋" in content
+        assert "002,이미지 분류 데이터셋" in content
+
+    @pytest.mark.parametrize(
+        "bytes_needed, expected",
+        [(1024, True), (1024 ** 4, False)],  # 1KB fits, 1TB does not
+        ids=["sufficient", "insufficient"],
+    )
+    def test_check_disk_space(self, downloader, temp_dir, bytes_needed, expected):
+        """Test disk space check against the available space."""
+        assert downloader._check_disk_space(bytes_needed, str(temp_dir)) is expected
+
+    @pytest.mark.parametrize(
+        "size, expected",
+        [(500, "500.0B"), (1024, "1.0KiB"), (1024 ** 2, "1.0MiB"), (1024 ** 3, "1.0GiB")],
+    )
+    def test_format_size(self, downloader, size, expected):
         """Test size formatting utility."""
-        downloader = AIHubDownloader()
-
-        assert downloader._format_size(1024) == "1.0KiB"
-        assert downloader._format_size(1024 * 1024) == "1.0MiB"
-        assert downloader._format_size(1024 * 1024 * 1024) == "1.0GiB"
-        assert downloader._format_size(500) == "500.0B"
-
-    def test_get_raw_url(self):
+        assert downloader._format_size(size) == expected
+
+    @pytest.mark.parametrize(
+        "dataset_key, file_keys, expected",
+        [
+            ("001", "all", "https://api.aihub.or.kr/down/0.5/001.do?fileSn=all"),
+            ("002", "1,2,3", "https://api.aihub.or.kr/down/0.5/002.do?fileSn=1,2,3"),
+        ],
+    )
+    def test_get_raw_url(self, downloader, dataset_key, file_keys, expected):
         """Test raw URL generation."""
-        downloader = AIHubDownloader()
-
-        url = downloader.get_raw_url("001", "all")
-        assert url == "https://api.aihub.or.kr/down/0.5/001.do?fileSn=all"
-
-        url = downloader.get_raw_url("002", "1,2,3")
-        assert url == "https://api.aihub.or.kr/down/0.5/002.do?fileSn=1,2,3"
+        assert downloader.get_raw_url(dataset_key, file_keys) == expected
 
 
 class TestDownloadStatus:
@@ -329,28 +298,30 @@ class TestDownloadStatus:
         assert status.is_error() is False
         assert "completed successfully" in status.get_message()
 
-    def test_error_statuses(self):
-        """Test error status properties."""
-        error_statuses = [
+    @pytest.mark.parametrize(
+        "status",
+        [
             DownloadStatus.NETWORK_ERROR,
             DownloadStatus.PRIVILEGE_ERROR,
             DownloadStatus.AUTHENTICATION_ERROR,
             DownloadStatus.FILE_NOT_FOUND,
             DownloadStatus.INSUFFICIENT_DISK_SPACE,
             DownloadStatus.UNKNOWN_ERROR
-        ]
-
-        for status in error_statuses:
-            assert status.is_success() is False
-            assert status.is_error() is True
-            assert status.get_message() is not None
+        ],
+        ids=lambda status: status.name,
+    )
+    def test_error_status(self, status):
+        """Test error status properties."""
+        assert status.is_success() is False
+        assert status.is_error() is True
+        assert status.get_message() is not None
 
-    def test_all_status_messages(self):
-        """Test that all statuses have meaningful messages."""
-        for status in DownloadStatus:
-            message = status.get_message()
-            assert isinstance(message, str)
-            assert len(message) > 0
+    @pytest.mark.parametrize("status", list(DownloadStatus), ids=lambda status: status.name)
+    def test_status_has_message(self, status):
+        """Test that every status has a meaningful message."""
+        message = status.get_message()
+        assert isinstance(message, str)
+        assert len(message) > 0
 
 
 class TestAIHubDownloaderIntegration:
@@ -358,78 +329,55 @@ class TestAIHubDownloaderIntegration:
 
     @pytest.mark.integration
     @pytest.mark.download
-    def test_full_download_flow_mock(self, temp_dir):
+    def test_full_download_flow_mock(self, downloader, temp_dir, mocked_responses):
         """Test complete download flow with mocked responses."""
-        with responses.RequestsMock() as rsps:
-            # Mock dataset info
-            rsps.add(
-                responses.GET,
-                "https://api.aihub.or.kr/info/dataset.do",
-                body="""UTF-8
-output normally
-modify the character information
-================================================================================
-데이터셋 목록
-================================================================================
-001,테스트 데이터셋
-================================================================================
-""",
-                status=200
-            )
-
-            # Mock file tree
-            rsps.add(
-                responses.GET,
-                "https://api.aihub.or.kr/info/001.do",
-                body="""UTF-8
-output normally
-modify the character information
-test_dataset
-└── test.txt | 1KB | 1""",
-                status=200
-            )
-
-            # Mock download
-            rsps.add(
-                responses.GET,
-                "https://api.aihub.or.kr/down/0.5/001.do?fileSn=all",
-                body="다운로드가 시작됩니다.",
-                status=200
-            )
-
-            downloader = AIHubDownloader()
-
-            # Test dataset info
-            datasets = downloader.get_dataset_info()
-            assert datasets is not None
-            assert len(datasets) == 1
-
-            # Test file tree
-            file_tree, error_message = downloader.get_file_tree("001")
-            assert error_message is None
-            assert file_tree is not None
-            assert "test_dataset" in file_tree
-
-            # Test actual download call
-            result = downloader.download_dataset("001", "all", str(temp_dir))
-            assert result == DownloadStatus.SUCCESS
+        # Mock dataset info
+        register_dataset_info(mocked_responses, FULL_FLOW_DATASET_BODY, status=200, content_type=UTF8_TEXT)
+
+        # Mock file tree
+        mocked_responses.add(
+            responses.GET,
+            "https://api.aihub.or.kr/info/001.do",
+            body=FULL_FLOW_TREE_BODY,
+            status=200,
+            content_type=UTF8_TEXT
+        )
+
+        # Mock download
+        mocked_responses.add(
+            responses.GET,
+            "https://api.aihub.or.kr/down/0.5/001.do?fileSn=all",
+            body=FULL_FLOW_DOWNLOAD_BODY,
+            status=200,
+            content_type=UTF8_TEXT
+        )
+
+        # Test dataset info
+        datasets = downloader.get_dataset_info()
+        assert datasets is not None
+        assert len(datasets) == 1
+
+        # Test file tree
+        file_tree, error_message = downloader.get_file_tree("001")
+        assert error_message is None
+        assert file_tree is not None
+        assert "test_dataset" in file_tree
+
+        # Test actual download call
+        result = downloader.download_dataset("001", "all", str(temp_dir))
+        assert result == DownloadStatus.SUCCESS
 
     @pytest.mark.api
     @pytest.mark.slow
-    def test_real_api_interaction(self):
+    @pytest.mark.skipif(not os.environ.get("AIHUBKR_RUN_API_TESTS"), reason="set AIHUBKR_RUN_API_TESTS=1 to run")
+    def test_real_api_interaction(self, downloader, api_reachable):
         """Test with real API interaction (marked as slow)."""
         # This test requires internet connection and may use real API
-        # It's marked as slow and should be run separately
-        downloader = AIHubDownloader()
-
-        # Test dataset info (this might fail if API is down)
-        try:
-            datasets = downloader.get_dataset_info()
-            if datasets is not None:
-                assert isinstance(datasets, list)
-                for dataset_id, dataset_name in datasets:
-                    assert isinstance(dataset_id, str)
-                    assert isinstance(dataset_name, str)
-        except Exception:
-            # API might be unavailable, which is acceptable for this test
-            pass
+        # It's opt-in via AIHUBKR_RUN_API_TESTS so default runs never hit the network,
+        # and skipped up front when the API host cannot be reached
+        datasets = downloader.get_dataset_info()
+        if datasets is not None:
+            assert isinstance(datasets, list)
+            for dataset_id, dataset_name in datasets:
+                assert isinstance(dataset_id, str)
+                assert isinstance(dataset_name, str)
@@ -11,8 +11,7 @@
 # @author Jung-In An <ji5489@gmail.com>
 # @with Claude Sonnet 4 (Cutoff 2025/06/16)
 
-from pathlib import Path
-from unittest.mock import Mock
+import logging
 
 import pytest
 
@@ -40,6 +39,15 @@ class TestAIHubResponseParser:
         assert sizeof_fmt(1024 * 1024 * 1024 * 1024) == "1.0TiB"
         assert sizeof_fmt(1024 * 1024 * 1024 * 1024 * 1024) == "1.0PiB"
 
+    def test_sizeof_fmt_beyond_tebibytes(self):
+        """Test size formatting past the comparison fast path, including non-finite values."""
+        assert sizeof_fmt(1024 ** 6) == "1.0EiB"
+        assert sizeof_fmt(1024 ** 8) == "1.0YiB"
+        assert sizeof_fmt(1024 ** 8 - 1) == "1.0YiB"  # rounds up into the next unit
+        assert sizeof_fmt(1024 ** 5, ignore_float=True) == "1PiB"
+        assert sizeof_fmt(float("inf")) == "infYiB"
+        assert sizeof_fmt(float("nan")) == "nanYiB"
+
     def test_parse_tree_output_simple(self):
         """Test parsing simple tree output."""
         tree_output = """dataset_001
@@ -163,9 +171,9 @@ class TestAIHubResponseParser:
         parser = AIHubResponseParser()
 
         # Create a simple tree structure
-        root = parser.Node(path=Path("dataset_001"))
-        data_dir = parser.Node(path=Path("data"), parent=root)
-        file_node = parser.Node(path=Path("file.txt"), parent=data_dir)
+        root = parser.Node(path="dataset_001")
+        data_dir = parser.Node(path="data", parent=root)
+        file_node = parser.Node(path="file.txt", parent=data_dir)
 
         # Test full path resolution
         assert str(root.full_path()) == "dataset_001"
@@ -178,7 +186,7 @@ class TestAIHubResponseParser:
 
         # Create a node with file information
         node = parser.Node(
-            path=Path("test.txt"),
+            path="test.txt",
             file_key="1",
             file_display_size=1024
         )
@@ -192,8 +200,8 @@ class TestAIHubResponseParser:
         parser = AIHubResponseParser()
 
         # Create a directory node
-        node = parser.Node(path=Path("data"))
-        child = parser.Node(path=Path("file.txt"), parent=node)
+        node = parser.Node(path="data")
+        child = parser.Node(path="file.txt", parent=node)
         node.children.append(child)
 
         # Test dictionary conversion
@@ -201,6 +209,20 @@ class TestAIHubResponseParser:
         assert "data" in result
         assert isinstance(result["data"], list)
 
+    def test_node_iter_files(self):
+        """Test iterating files without materializing the tree as dicts."""
+        tree_output = """dataset_001
+├── README.txt | 1.5KB | 1
+├── data/
+│   └── train.txt | 2.3MB | 2
+└── metadata.json | 15KB | 3"""
+
+        parser = AIHubResponseParser()
+        tree, paths = parser.parse_tree_output(tree_output)
+
+        files = [(path, file_info) for path, is_file, _, file_info in paths if is_file]
+        assert list(tree.iter_files()) == files
+
     def test_parse_tree_output_complex_structure(self):
         """Test parsing complex tree structure."""
         tree_output = """dataset_001
@@ -391,18 +413,34 @@ dataset_001
         file_keys = [key for _, is_file, key, _ in paths if is_file and key is not None]
         assert file_keys == ["1", "2", "3", "4", "5"]
 
-    def test_parser_performance(self):
-        """Test parser performance with large tree structure."""
-        # Generate a large tree structure
-        tree_lines = ["large_dataset"]
+    def test_parser_connector_prefixed_root_after_preamble(self):
+        """Test that a connector-prefixed root line after the preamble is not parsed again as its own child."""
+        tree_output = """UTF-8
+output normally
+modify the character information
+└─dataset_001
+    ├─ README.txt | 1.5KB | 1
+    └─ data/
+        └─ train.txt | 2.3MB | 2"""
 
-        # Add 100 files in a nested structure
-        for i in range(100):
-            level = i % 5 + 1
-            indent = "    " * level
-            tree_lines.append(f"{indent}└── file_{i:03d}.txt | 1KB | {i+1}")
+        parser = AIHubResponseParser()
+        tree, paths = parser.parse_tree_output(tree_output)
 
-        tree_output = "\n".join(tree_lines)
+        assert tree is not None
+        assert tree.path == "dataset_001"
+        assert [path for path, _, _, _ in paths] == [
+            "dataset_001",
+            "dataset_001/README.txt",
+            "dataset_001/data",
+            "dataset_001/data/train.txt"
+        ]
+
+    def test_parser_performance(self):
+        """Test parser performance with large tree structure."""
+        # Generate a large tree structure: root + 100 files in a nested structure
+        tree_output = "\n".join(
+            ["large_dataset"] + [f"{'    ' * (i % 5 + 1)}└── file_{i:03d}.txt | 1KB | {i+1}" for i in range(100)]
+        )
 
         parser = AIHubResponseParser()
 
@@ -421,7 +459,7 @@ dataset_001
         # Parsing should be fast (less than 1 second)
         assert parsing_time < 1.0, f"Parsing took too long: {parsing_time:.3f}s"
 
-        print(f"Parsed {len(paths)} nodes in {parsing_time:.3f} seconds")
+        logging.getLogger(__name__).debug("Parsed %d nodes in %.3f seconds", len(paths), parsing_time)
 
     def test_gui_display_issue_fix(self):
         """Test that tree characters are not included in file paths for GUI display."""
@@ -465,4 +503,4 @@ dataset_001
             # Verify the path is clean and matches expected format
             assert path in expected_paths, f"Unexpected path: {path}"
 
-        print("✅ GUI display issue fixed: All file paths are clean without tree characters")
+        logging.getLogger(__name__).debug("GUI display issue fixed: all file paths are clean without tree characters")